@@ -0,0 +1,195 @@
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE', which is part of this source code package.
+"""
+Benchmark planners on the fixed corpus of seeded scenarios in scenarios.py
+
+Usage:
+    python benchmarks/run_benchmarks.py --runs 5 --output results.json
+    python benchmarks/run_benchmarks.py --baseline previous.json --output results.json
+    python benchmarks/run_benchmarks.py --memory --output results.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+from rrt_algorithms.rrt.rrt import RRT
+from rrt_algorithms.rrt.rrt_connect import RRTConnect
+from rrt_algorithms.rrt.rrt_star import RRTStar
+from rrt_algorithms.rrt.rrt_star_bid import RRTStarBidirectional
+from rrt_algorithms.rrt.rrt_star_bid_h import RRTStarBidirectionalHeuristic
+from rrt_algorithms.search_space.search_space import SearchSpace
+from rrt_algorithms.search_space.shape_search_space import ShapeSearchSpace
+from rrt_algorithms.utilities.geometry import dist_between_points, pairwise
+from scenarios import SCENARIOS
+
+# planner class, method to run it and additional arguments
+PLANNERS = {
+    "rrt": (RRT, "rrt_search", {}),
+    "rrt_star": (RRTStar, "rrt_star", {"rewire_count": 32}),
+    "rrt_connect": (RRTConnect, "rrt_connect", {}),
+    "rrt_star_bid": (RRTStarBidirectional, "rrt_star_bidirectional", {"rewire_count": 32}),
+    "rrt_star_bid_h": (RRTStarBidirectionalHeuristic, "rrt_star_bid_h", {"rewire_count": 32}),
+}
+
+# metrics compared against a baseline, and whether higher values are better
+METRICS = {
+    "success_rate": True,
+    "wall_time": False,
+    "samples_per_sec": True,
+    "collision_checks_per_sec": True,
+    "nn_queries_per_sec": True,
+    "peak_memory": False,
+    "path_cost": False,
+}
+
+
+def plan(scenario, planner_name, seed):
+    """
+    Build a search space and a planner for a scenario, and search a path
+    :param scenario: scenario to solve
+    :param planner_name: name of planner in PLANNERS
+    :param seed: seed of planner
+    :return: planner, and path found or None
+    """
+    planner_type, method, kwargs = PLANNERS[planner_name]
+    # scenarios with shapes list them, boxes alone are given as an array
+    search_space_type = ShapeSearchSpace if isinstance(scenario.obstacles, list) else SearchSpace
+    X = search_space_type(scenario.dimension_lengths, scenario.obstacles)
+    planner = planner_type(X, scenario.q, scenario.x_init, scenario.x_goal, scenario.max_samples,
+                           scenario.q / 8, scenario.prc, stats=True, seed=seed, **kwargs)
+    return planner, getattr(planner, method)()
+
+
+def run_once(scenario, planner_name, seed, memory=False):
+    """
+    Run a planner once on a scenario
+    Timing is measured on a run of its own, tracing memory allocations would slow it down.
+    :param scenario: scenario to solve
+    :param planner_name: name of planner in PLANNERS
+    :param seed: seed of planner
+    :param memory: whether to measure peak memory too, in a second run with the same seed
+    :return: dict of measurements
+    """
+    start = time.perf_counter()
+    planner, path = plan(scenario, planner_name, seed)
+    wall_time = time.perf_counter() - start
+
+    peak_memory = None
+    if memory:
+        tracemalloc.start()
+        plan(scenario, planner_name, seed)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    stats = planner.stats.as_dict()
+    collision_checks = stats.get("collision_free_count", 0) + stats.get("collision_edges_count", 0)
+    nn_queries = sum(stats.get(f"{query}_count", 0) for query in ("nearest", "nearby", "within"))
+    return {
+        "seed": seed,
+        "success": path is not None,
+        "wall_time": wall_time,
+        "samples": planner.samples_taken,
+        "samples_per_sec": planner.samples_taken / wall_time,
+        "collision_checks_per_sec": collision_checks / wall_time,
+        "nn_queries_per_sec": nn_queries / wall_time,
+        "peak_memory": peak_memory,
+        "path_cost": None if path is None else float(sum(dist_between_points(a, b) for a, b in pairwise(path))),
+        "stats": stats,
+    }
+
+
+def summarize(runs):
+    """
+    Aggregate measurements of several runs
+    :param runs: list of measurements, as returned by run_once
+    :return: dict of aggregated metrics
+    """
+    costs = [run["path_cost"] for run in runs if run["success"]]
+    return {
+        "runs": len(runs),
+        "success_rate": sum(run["success"] for run in runs) / len(runs),
+        "wall_time": statistics.median(run["wall_time"] for run in runs),
+        "samples_per_sec": statistics.median(run["samples_per_sec"] for run in runs),
+        "collision_checks_per_sec": statistics.median(run["collision_checks_per_sec"] for run in runs),
+        "nn_queries_per_sec": statistics.median(run["nn_queries_per_sec"] for run in runs),
+        "peak_memory": None if runs[0]["peak_memory"] is None else max(run["peak_memory"] for run in runs),
+        "path_cost": statistics.median(costs) if costs else None,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results against a baseline
+    :param results: results of this benchmark
+    :param baseline: results of a previous benchmark
+    :param tolerance: relative change tolerated before a metric is reported as a regression
+    :return: list of regressions, in form (scenario/planner, metric, baseline value, value)
+    """
+    regressions = []
+    for key, summary in results["summary"].items():
+        if key not in baseline["summary"]:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = baseline["summary"][key][metric], summary[metric]
+            if old is None or new is None or old == 0:
+                continue
+            change = (new - old) / abs(old)
+            if change < -tolerance if higher_is_better else change > tolerance:
+                regressions.append((key, metric, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", default=[scenario.name for scenario in SCENARIOS],
+                        help="scenarios to run")
+    parser.add_argument("--planners", nargs="+", default=list(PLANNERS), choices=list(PLANNERS),
+                        help="planners to run")
+    parser.add_argument("--runs", type=int, default=5, help="number of seeded runs of each planner per scenario")
+    parser.add_argument("--output", default="benchmark_results.json", help="file to write results to")
+    parser.add_argument("--baseline", help="results of a previous benchmark to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="relative change tolerated before a metric is reported as a regression")
+    parser.add_argument("--memory", action="store_true",
+                        help="measure peak memory too, tracing allocations in a separate run of each seed")
+    args = parser.parse_args()
+
+    scenarios = {scenario.name: scenario for scenario in SCENARIOS}
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "runs": {},
+        "summary": {},
+    }
+    for scenario_name in args.scenarios:
+        for planner_name in args.planners:
+            key = f"{scenario_name}/{planner_name}"
+            runs = [run_once(scenarios[scenario_name], planner_name, seed, args.memory) for seed in range(args.runs)]
+            results["runs"][key] = runs
+            results["summary"][key] = summary = summarize(runs)
+            memory = "" if summary["peak_memory"] is None else f"  memory {summary['peak_memory'] / 2 ** 20:7.1f}MiB"
+            print(f"{key:40} success {summary['success_rate']:5.0%}  time {summary['wall_time']:8.3f}s  "
+                  f"samples/s {summary['samples_per_sec']:9.0f}  checks/s {summary['collision_checks_per_sec']:9.0f}  "
+                  f"nn/s {summary['nn_queries_per_sec']:9.0f}{memory}")
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for key, metric, old, new in regressions:
+            print(f"regression: {key} {metric} {old:.4g} -> {new:.4g}")
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
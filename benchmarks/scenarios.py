@@ -0,0 +1,173 @@
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE', which is part of this source code package.
+import numpy as np
+
+from rrt_algorithms.search_space.shapes import Capsule, ConvexPolytope, OrientedBox, Sphere
+
+
+class Scenario(object):
+    def __init__(self, name, dimension_lengths, obstacles, x_init, x_goal, q, max_samples, prc):
+        """
+        Reproducible planning problem
+        :param name: unique name of scenario
+        :param dimension_lengths: range of each dimension
+        :param obstacles: array of obstacles in form (x_lower, y_lower, ..., x_upper, y_upper, ...),
+        or list of boxes and shapes of rrt_algorithms/search_space/shapes.py
+        :param x_init: tuple, initial location
+        :param x_goal: tuple, goal location
+        :param q: length of edges added to tree
+        :param max_samples: max number of samples to take
+        :param prc: probability of checking whether there is a solution
+        """
+        self.name = name
+        self.dimension_lengths = dimension_lengths
+        self.obstacles = obstacles
+        self.x_init = x_init
+        self.x_goal = x_goal
+        self.q = q
+        self.max_samples = max_samples
+        self.prc = prc
+
+    @property
+    def dimensions(self):
+        """
+        Number of dimensions of the Search Space
+        """
+        return len(self.dimension_lengths)
+
+
+def bounds(dimensions, size=100):
+    """
+    Cube-shaped Search Space bounds
+    :param dimensions: number of dimensions
+    :param size: length of each side
+    :return: range of each dimension
+    """
+    return np.array([(0, size)] * dimensions)
+
+
+def clutter(dimensions, n, seed, size=100, max_edge_length=None):
+    """
+    Randomly placed boxes, none of which contain the corners of the space
+    :param dimensions: number of dimensions
+    :param n: number of boxes
+    :param seed: seed of random boxes
+    :param size: length of each side of the space
+    :param max_edge_length: max length of each side of boxes, a tenth of the size of the space if None
+    :return: array of obstacles
+    """
+    max_edge_length = max_edge_length or size / 10
+    rng = np.random.default_rng(seed)
+    obstacles = np.empty((0, 2 * dimensions))
+    ends = np.array([np.zeros(dimensions), np.full(dimensions, size)])
+    while len(obstacles) < n:
+        edge_lengths = rng.uniform(max_edge_length / 10, max_edge_length, (n, dimensions))
+        lower = rng.uniform(0, size - edge_lengths)
+        upper = lower + edge_lengths
+        inside = np.any(np.all((ends[:, np.newaxis] >= lower) & (ends[:, np.newaxis] <= upper), axis=2), axis=0)
+        obstacles = np.vstack((obstacles, np.hstack((lower, upper))[~inside]))
+    return obstacles[:n]
+
+
+def mixed_shapes(dimensions, n, seed, size=100, max_extent=1):
+    """
+    Randomly placed boxes, oriented boxes, spheres, capsules and convex polytopes, in equal numbers,
+    none of which contain the corners of the space
+    :param dimensions: number of dimensions
+    :param n: number of shapes
+    :param seed: seed of random shapes
+    :param size: length of each side of the space
+    :param max_extent: max distance from the center of each shape to its boundary
+    :return: list of obstacles
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(2 * max_extent, size - 2 * max_extent, (n, dimensions))
+    extents = rng.uniform(max_extent / 10, max_extent / 2, (n, dimensions))
+    rotations, _ = np.linalg.qr(rng.normal(size=(n, dimensions, dimensions)))
+    obstacles = []
+    for i, (center, extent, rotation) in enumerate(zip(centers, extents, rotations)):
+        kind = i % 5
+        if kind == 0:
+            obstacles.append(np.append(center - extent, center + extent))
+        elif kind == 1:
+            obstacles.append(OrientedBox(center, extent, rotation))
+        elif kind == 2:
+            obstacles.append(Sphere(center, extent[0]))
+        elif kind == 3:
+            axis = rotation[:, 0] * extent[0]
+            obstacles.append(Capsule(center - axis, center + axis, extent[1]))
+        else:
+            # simplex around center
+            normals = np.vstack((rotation, -rotation.sum(axis=0)))
+            obstacles.append(ConvexPolytope(normals, normals @ center + extent[0]))
+    return obstacles
+
+
+def narrow_passage(dimensions, width, size=100):
+    """
+    Wall across the first dimension with a single square hole in its center
+    :param dimensions: number of dimensions
+    :param width: width of hole
+    :param size: length of each side of the space
+    :return: array of obstacles
+    """
+    obstacles = []
+    wall = (0.45 * size, 0.55 * size)
+    hole = (size / 2 - width / 2, size / 2 + width / 2)
+    for axis in range(1, dimensions):
+        for lower, upper in ((0, hole[0]), (hole[1], size)):
+            obstacle_lower, obstacle_upper = np.zeros(dimensions), np.full(dimensions, float(size))
+            obstacle_lower[0], obstacle_upper[0] = wall
+            obstacle_lower[axis], obstacle_upper[axis] = lower, upper
+            obstacles.append(np.append(obstacle_lower, obstacle_upper))
+    return np.array(obstacles)
+
+
+def maze(dimensions, walls, gap, size=100):
+    """
+    Walls across the first dimension, with gaps alternating between either end of the second dimension
+    :param dimensions: number of dimensions
+    :param walls: number of walls
+    :param gap: width of gap in each wall
+    :param size: length of each side of the space
+    :return: array of obstacles
+    """
+    obstacles = []
+    thickness = size / (4 * (walls + 1))
+    for i in range(walls):
+        center = size * (i + 1) / (walls + 1)
+        obstacle_lower, obstacle_upper = np.zeros(dimensions), np.full(dimensions, float(size))
+        obstacle_lower[0], obstacle_upper[0] = center - thickness / 2, center + thickness / 2
+        if i % 2 == 0:
+            obstacle_upper[1] = size - gap
+        else:
+            obstacle_lower[1] = gap
+        obstacles.append(np.append(obstacle_lower, obstacle_upper))
+    return np.array(obstacles)
+
+
+def corners(dimensions, size=100):
+    """
+    Opposite corners of the space
+    :param dimensions: number of dimensions
+    :param size: length of each side of the space
+    :return: tuple, initial location, tuple, goal location
+    """
+    return (0,) * dimensions, (size,) * dimensions
+
+
+SCENARIOS = [
+    Scenario("2d_clutter", bounds(2), clutter(2, 100, seed=0), *corners(2), q=4, max_samples=2048, prc=0.05),
+    Scenario("2d_narrow_passage", bounds(2), narrow_passage(2, 4), *corners(2), q=4, max_samples=4096, prc=0.05),
+    Scenario("2d_maze", bounds(2), maze(2, 4, 10), *corners(2), q=4, max_samples=4096, prc=0.05),
+    Scenario("3d_clutter", bounds(3), clutter(3, 500, seed=1), *corners(3), q=8, max_samples=2048, prc=0.05),
+    Scenario("3d_narrow_passage", bounds(3), narrow_passage(3, 10), *corners(3), q=8, max_samples=4096, prc=0.05),
+    Scenario("3d_large_clutter", bounds(3), clutter(3, 100000, seed=4, max_edge_length=1), *corners(3), q=8,
+             max_samples=2048, prc=0.05),
+    Scenario("3d_mixed_shapes", bounds(3), mixed_shapes(3, 20000, seed=5), *corners(3), q=8, max_samples=2048,
+             prc=0.05),
+    Scenario("3d_maze", bounds(3), maze(3, 3, 15), *corners(3), q=8, max_samples=4096, prc=0.05),
+    Scenario("6d_clutter", bounds(6), clutter(6, 1000, seed=2), *corners(6), q=16, max_samples=4096, prc=0.05),
+    Scenario("6d_narrow_passage", bounds(6), narrow_passage(6, 30), *corners(6), q=16, max_samples=4096, prc=0.05),
+    Scenario("10d_clutter", bounds(10), clutter(10, 1000, seed=3), *corners(10), q=24, max_samples=4096, prc=0.05),
+]
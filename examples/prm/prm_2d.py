@@ -0,0 +1,34 @@
+# This file is subject to the terms and conditions defined in
+# file 'LICENSE', which is part of this source code package.
+import numpy as np
+
+from rrt_algorithms.prm.prm import PRM
+from rrt_algorithms.search_space.search_space import SearchSpace
+from rrt_algorithms.utilities.plotting import Plot
+
+X_dimensions = np.array([(0, 100), (0, 100)])  # dimensions of Search Space
+# obstacles
+Obstacles = np.array([(20, 20, 40, 40), (20, 60, 40, 80),
+                     (60, 20, 80, 40), (60, 60, 80, 80)])
+x_init = (0, 0)  # starting location
+x_goal = (100, 100)  # goal location
+
+k = 10  # number of nearest neighbors to connect each sample to
+n = 1024  # number of samples in roadmap
+
+# create Search Space
+X = SearchSpace(X_dimensions, Obstacles)
+
+# build roadmap once, then query it
+prm = PRM(X, k)
+prm.build(n)
+path = prm.query(x_init, x_goal)
+
+# plot
+plot = Plot("prm_2d")
+if path is not None:
+    plot.plot_path(X, path)
+plot.plot_obstacles(X, Obstacles)
+plot.plot_start(X, x_init)
+plot.plot_goal(X, x_goal)
+plot.draw(auto_open=True)